@@ -1,3 +1,4 @@
+import operator
 import sqlalchemy as sa
 import sqlalchemy.orm
 from sqlalchemy_hooks import events
@@ -9,10 +10,21 @@ db: sqlalchemy.orm.Session = SessionLocal()
 
 
 def repr_helper(*attrs):
+    if len(attrs) > 1:
+        getter = operator.attrgetter(*attrs)
+    elif attrs:
+        single_getter = operator.attrgetter(*attrs)
+
+        def getter(obj):
+            return (single_getter(obj),)
+    else:
+        def getter(obj):
+            return ()
+    attr_fmt = ', '.join(f'{attr}={{!r}}' for attr in attrs)
+
     def _repr(self):
         clsname = type(self).__name__
-        attr_repr = ', '.join(f'{attr}={getattr(self, attr)!r}' for attr in attrs)
-        return f'{clsname}({attr_repr})'
+        return f'{clsname}({attr_fmt.format(*getter(self))})'
     return _repr
 
 
@@ -1,7 +1,11 @@
 import logging
 import inspect
 import itertools as it
-from typing import Union, Iterable, NamedTuple, Optional, Callable
+from collections import deque
+from collections.abc import MutableMapping
+from functools import cache, cached_property, lru_cache, partial
+from typing import Union, NamedTuple, Optional, Callable
+from weakref import WeakKeyDictionary
 
 import sqlalchemy as sa
 import sqlalchemy.event
@@ -12,112 +16,185 @@ from sqlalchemy.engine import Engine
 
 
 logger = logging.getLogger(__name__)
+_DEBUG = logger.isEnabledFor
+
+
+@lru_cache(maxsize=None)
+def _callback_args(method: Callable) -> tuple[str, ...]:
+    """Parameter names of an event method, excluding self.
+
+    Plain functions are read straight from their code object, anything else
+    (bound methods, wrapped functions, an explicit __signature__, keyword only
+    arguments) falls back to inspect.signature.
+    """
+    if (
+        not inspect.isfunction(method)
+        or method.__code__.co_kwonlyargcount
+        or hasattr(method, "__wrapped__")
+        or hasattr(method, "__signature__")
+    ):
+        names = inspect.signature(method).parameters.keys()
+    else:
+        code = method.__code__
+        count = (
+            code.co_argcount
+            + bool(code.co_flags & inspect.CO_VARARGS)
+            + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        )
+        names = code.co_varnames[:count]
+    return tuple(name for name in names if name != "self")
+
+
+def _event_names(event_class: sa.event.Events) -> list[str]:
+    return [
+        evt
+        for evt in dir(event_class)
+        if not evt.startswith("_") and evt != "dispatch"
+    ]
 
 
 class EventInfo(NamedTuple):
     target_type: type
-    callback_args: Iterable[str]
+    callback_args: tuple[str, ...]
+    arg_count: int
 
     @classmethod
     def from_event_class(cls, event_class: sa.event.Events) -> dict[str:"EventInfo"]:
-        events = (
-            evt
-            for evt in dir(event_class)
-            if not evt.startswith("_") and evt != "dispatch"
-        )
         output = {}
-        for event in events:
+        for event in _event_names(event_class):
             method = getattr(event_class, event)
-            signature = inspect.signature(method)
-            args = tuple(name for name in signature.parameters.keys() if name != "self")
-            output[event] = cls(event_class._dispatch_target, args)
+            args = _callback_args(method)
+            output[event] = cls(event_class._dispatch_target, args, len(args))
         return output
 
-    @property
-    def arg_count(self):
-        return len(self.callback_args)
-
     def kwargs(self, args):
         return dict(zip(self.callback_args, args))
 
 
-pool_events = EventInfo.from_event_class(sqlalchemy.events.PoolEvents)
-connection_events = EventInfo.from_event_class(sa.events.ConnectionEvents)
-dialect_events = EventInfo.from_event_class(sa.events.DialectEvents)
-ddl_events = EventInfo.from_event_class(sa.events.DDLEvents)
-session_events = EventInfo.from_event_class(sa.orm.events.SessionEvents)
-mapper_events = EventInfo.from_event_class(sa.orm.events.MapperEvents)
-instance_events = EventInfo.from_event_class(sa.orm.events.InstanceEvents)
-attribute_events = EventInfo.from_event_class(sa.orm.events.AttributeEvents)
-query_events = EventInfo.from_event_class(sa.orm.events.QueryEvents)
-instrmentation_events = EventInfo.from_event_class(sa.orm.events.InstrumentationEvents)
-synthetic_mapper_events = {
-    "after_save": EventInfo(sa.orm.Mapper, ("mapper", "connection", "target")),
-    "before_save": EventInfo(sa.orm.Mapper, ("mapper", "connection", "target")),
-    "before_touch": EventInfo(sa.orm.Mapper, ("mapper", "connection", "target")),
-    "after_touch": EventInfo(sa.orm.Mapper, ("mapper", "connection", "target")),
+# Later entries take precedence when event names collide in `events`
+_EVENT_CLASSES = {
+    "pool_events": sa.events.PoolEvents,
+    "connection_events": sa.events.ConnectionEvents,
+    "dialect_events": sa.events.DialectEvents,
+    "ddl_events": sa.events.DDLEvents,
+    "session_events": sa.orm.events.SessionEvents,
+    "mapper_events": sa.orm.events.MapperEvents,
+    "instance_events": sa.orm.events.InstanceEvents,
+    "attribute_events": sa.orm.events.AttributeEvents,
+    "query_events": sa.orm.events.QueryEvents,
+    "instrmentation_events": sa.orm.events.InstrumentationEvents,
 }
-events = (
-    pool_events
-    | connection_events
-    | dialect_events
-    | ddl_events
-    | session_events
-    | mapper_events
-    | instance_events
-    | attribute_events
-    | query_events
-    | instrmentation_events
-    | synthetic_mapper_events
+
+
+@cache
+def events_for(name: str) -> dict[str, EventInfo]:
+    """EventInfo for each event of one of the _EVENT_CLASSES, built on first use"""
+    return EventInfo.from_event_class(_EVENT_CLASSES[name])
+
+
+def __getattr__(name):
+    if name in _EVENT_CLASSES:
+        return events_for(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_synthetic_mapper_args = ("mapper", "connection", "target")
+_synthetic_mapper_event = EventInfo(
+    sa.orm.Mapper, _synthetic_mapper_args, len(_synthetic_mapper_args)
 )
+synthetic_mapper_events = {
+    "after_save": _synthetic_mapper_event,
+    "before_save": _synthetic_mapper_event,
+    "before_touch": _synthetic_mapper_event,
+    "after_touch": _synthetic_mapper_event,
+}
+
+
+class _Events(MutableMapping):
+    """Map of every known event name to its EventInfo.
+
+    Only the event names are listed up front, the event class that owns a
+    name is introspected the first time that name is looked up. EventInfo for
+    other events, e.g. custom sa.event.Events subclasses, can be added like on
+    a dict and takes precedence over the built in events. The built in events
+    are a read only layer: deleting, popping or clearing only affects added
+    entries, and deleting a name that was not added raises KeyError.
+    """
+
+    def __init__(self):
+        self._extra = {}
+
+    @cached_property
+    def _owners(self) -> dict[str, Optional[str]]:
+        owners = {}
+        for name, event_class in _EVENT_CLASSES.items():
+            owners.update(dict.fromkeys(_event_names(event_class), name))
+        owners.update(dict.fromkeys(synthetic_mapper_events))
+        return owners
+
+    def __getitem__(self, event: str) -> EventInfo:
+        if event in self._extra:
+            return self._extra[event]
+        owner = self._owners[event]
+        if owner is None:
+            return synthetic_mapper_events[event]
+        return events_for(owner)[event]
+
+    def __contains__(self, event):
+        return event in self._extra or event in self._owners
+
+    def __setitem__(self, event: str, event_info: EventInfo):
+        self._extra[event] = event_info
+
+    def __delitem__(self, event: str):
+        del self._extra[event]
+
+    def pop(self, event: str, *default):
+        return self._extra.pop(event, *default)
+
+    def clear(self):
+        self._extra.clear()
+
+    def __iter__(self):
+        yield from self._extra
+        yield from (event for event in self._owners if event not in self._extra)
+
+    def __len__(self):
+        return len(self._owners.keys() | self._extra.keys())
+
+
+events = _Events()
+
+
+_listen = sa.event.listen
+_remove = sa.event.remove
+_SYNTHETIC = {
+    "after_save": ("after_insert", "after_update"),
+    "before_save": ("before_insert", "before_update"),
+    "after_touch": ("after_insert", "after_update", "after_delete"),
+    "before_touch": ("before_insert", "before_update", "before_delete"),
+}
 
 
 def register(target, event, func, **kwargs):
     """Proxy for sa.event.listen that handles dispatching synthetic_events"""
-    if event == "after_save":
-        sa.event.listen(target, "after_insert", func, **kwargs)
-        sa.event.listen(target, "after_update", func, **kwargs)
+    concrete_events = _SYNTHETIC.get(event, (event,))
+    for concrete_event in concrete_events:
+        _listen(target, concrete_event, func, **kwargs)
+    if event in _SYNTHETIC and _DEBUG(logging.DEBUG):
         logger.debug(
-            "Registered %s for after_insert and after_update events"
-            " for %s: %s synthetic event",
+            "Registered %s for %s events for %s: %s synthetic event",
             func,
+            ", ".join(concrete_events),
             target,
             event,
         )
-    elif event == "before_save":
-        sa.event.listen(target, "before_insert", func, **kwargs)
-        sa.event.listen(target, "before_update", func, **kwargs)
-        logger.debug(
-            "Registered %s for before_insert and before_update events"
-            " for %s: %s synthetic event",
-            func,
-            target,
-            event,
-        )
-    elif event == "after_touch":
-        sa.event.listen(target, "after_insert", func, **kwargs)
-        sa.event.listen(target, "after_update", func, **kwargs)
-        sa.event.listen(target, "after_delete", func, **kwargs)
-        logger.debug(
-            "Registered %s for after_insert, after_update, and after_delete"
-            " events for %s: %s synthetic event",
-            func,
-            target,
-            event,
-        )
-    elif event == "before_touch":
-        sa.event.listen(target, "before_insert", func, **kwargs)
-        sa.event.listen(target, "before_update", func, **kwargs)
-        sa.event.listen(target, "before_delete", func, **kwargs)
-        logger.debug(
-            "Registered %s for before_insert, before_update, and before_delete"
-            " events for %s: %s synthetic event",
-            func,
-            target,
-            event,
-        )
-    else:
-        sa.event.listen(target, event, func, **kwargs)
+
+
+def unregister(target, event, func):
+    """Proxy for sa.event.remove that handles synthetic_events"""
+    for concrete_event in _SYNTHETIC.get(event, (event,)):
+        _remove(target, concrete_event, func)
 
 
 class DefferredTarget(NamedTuple):
@@ -128,6 +205,28 @@ class DefferredTarget(NamedTuple):
 
 
 class EventListener:
+    __slots__ = (
+        "targets",
+        "conditions",
+        "use_kwargs",
+        "once",
+        "name",
+        "func",
+        "args",
+        "method_name",
+        "method_class",
+        "_all_arg_names",
+        "_build_kwargs",
+        "_invoke",
+        "_targets_t",
+        "_events_t",
+        "_conditions_t",
+        "_callback_templates",
+        "_registered",
+        "_chained",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         target: object,
@@ -136,9 +235,12 @@ class EventListener:
         use_kwargs: bool = False,
         once: bool = False,
     ):
-        self.targets = [(target, event)]
-        self.conditions = [None]
+        self.targets = deque([(target, event)])
+        self.conditions = deque([None])
+        self._all_arg_names = ()
         self.use_kwargs = use_kwargs
+        if use_kwargs:
+            self._add_arg_names(event)
         self.once = once
 
         self.name = None
@@ -146,6 +248,10 @@ class EventListener:
         self.args = []
         self.method_name = None
         self.method_class = None
+        # the base registration is kept for remove(), chain registrations are
+        # made once per base fire so they only live as long as their target
+        self._registered = []
+        self._chained = WeakKeyDictionary()
 
     def __set_name__(self, class_, name):
         self.method_name = name
@@ -155,63 +261,94 @@ class EventListener:
     def _is_method_callback(self):
         return self.method_name is not None
 
-    def _get_kwargs(self, args):
-        arg_names = it.chain.from_iterable(evt.callback_args for _, evt in self.targets)
-        return dict(zip(arg_names, args))
+    @staticmethod
+    def _kwargs_builder(arg_names: tuple[str, ...]) -> Callable[[tuple], dict]:
+        return lambda args: dict(zip(arg_names, args))
+
+    def _add_arg_names(self, event: str):
+        """Extend the names use_kwargs maps the callback args onto"""
+        event_info = events.get(event)
+        if event_info is None:
+            raise ValueError(
+                f"No EventInfo for event {event!r}, use_kwargs needs its argument names"
+            )
+        self._all_arg_names = self._all_arg_names + event_info.callback_args
+        self._build_kwargs = self._kwargs_builder(self._all_arg_names)
+
+    @staticmethod
+    def _invoke_args(func, args):
+        return func(*args)
+
+    def _kwargs_invoker(self) -> Callable[[Callable, tuple], object]:
+        build_kwargs = self._build_kwargs
+
+        def invoke_kwargs(func, args):
+            return func(**build_kwargs(args))
+
+        return invoke_kwargs
 
-    def _get_callback(self, i: int, arg_accum: list = None) -> Callable:
-        do_execute = i >= len(self.targets)
-        arg_accum = arg_accum or []
+    def _freeze(self):
+        """Snapshot the chain built up by chain() for indexed reads at fire time"""
+        self._targets_t = tuple(target for target, _ in self.targets)
+        self._events_t = tuple(event for _, event in self.targets)
+        self._conditions_t = tuple(self.conditions)
+        # chain() may still extend the kwargs names until the listener is frozen
+        self._invoke = self._kwargs_invoker() if self.use_kwargs else self._invoke_args
 
-        if do_execute:
-            return self._wrapper_callback(arg_accum)
-        else:
-            return self._register_callback(i, arg_accum)
+    def _make_stage(self, i: int) -> Callable[[tuple], Callable]:
+        if i >= len(self._targets_t):
+            return self._wrapper_callback
+        return partial(self._register_callback, i)
+
+    def _get_callback(self, i: int, arg_accum: Optional[tuple] = None) -> Callable:
+        if arg_accum is None:
+            arg_accum = ()
+        return self._callback_templates[i](arg_accum)
+
+    def _wrapper_callback(self, arg_accum: tuple) -> Callable:
+        frozen = tuple(arg_accum)
+        invoke = self._invoke
 
-    def _wrapper_callback(self, arg_accum: list) -> Callable:
         def wrapper(*args):
-            logger.debug("got here")
-            all_args = arg_accum + list(args)
-            if self.use_kwargs:
-                return self.func(**self._get_kwargs(all_args))
-            return self.func(*all_args)
+            return invoke(self.func, frozen + args)
 
         return wrapper
 
-    def _condition_met(self, i, args):
-        condition = self.conditions[i]
-        if condition is None:
-            return True
-        if self.use_kwargs:
-            return condition(**self._get_kwargs(args))
-        else:
-            return condition(*args)
-
-    def _register_callback(self, i: int, arg_accum: list = None) -> Callable:
+    def _register_callback(self, i: int, arg_accum: tuple = ()) -> Callable:
         # chain listeners are always single execution, only the base of the
         # chain can be called multiple times.
+        next_stage = self._callback_templates[i + 1]
+        # bind everything the closure reads on each fire to locals up front
+        base_target = self._targets_t[i]
+        event = self._events_t[i]
+        condition = self._conditions_t[i]
+        invoke = self._invoke
+        registered = self._registered
+        chained = self._chained
+        deferred = isinstance(base_target, DefferredTarget)
+        once = self.once or i > 0
 
         def _register(*args):
-            nonlocal arg_accum
-            arg_accum += list(args)
-            if not self._condition_met(i, arg_accum):
+            all_args = (*arg_accum, *args)
+            if condition is not None and not invoke(condition, all_args):
                 return
 
-            target, event = self.targets[i]
-            if isinstance(target, DefferredTarget):
-                target = target(*args)
-
-            once = self.once or i > 0
-
-            register(target, event, self._get_callback(i + 1, arg_accum), once=once)
-            logger.debug(
-                "Performed %s%sregistration for %s: %s of %s",
-                "one time " if once else "",
-                "chain " if i > 0 else "",
-                target,
-                event,
-                self.name,
-            )
+            target = base_target(*args) if deferred else base_target
+            callback = next_stage(all_args)
+            if i == 0:
+                registered.append((target, event, callback))
+            else:
+                chained.setdefault(target, []).append((event, callback))
+            register(target, event, callback, once=once)
+            if _DEBUG(logging.DEBUG):
+                logger.debug(
+                    "Performed %s%sregistration for %s: %s of %s",
+                    "one time " if once else "",
+                    "chain " if i > 0 else "",
+                    target,
+                    event,
+                    self.name,
+                )
 
         return _register
 
@@ -220,6 +357,10 @@ class EventListener:
             self.name = func.__name__
         func.__listener__ = self
         self.func = func
+        self._freeze()
+        self._callback_templates = [
+            self._make_stage(i) for i in range(len(self._targets_t) + 1)
+        ]
         self._get_callback(0)()
         return func
 
@@ -231,11 +372,18 @@ class EventListener:
     ) -> "EventListener":
         self.targets.append((target, event))
         self.conditions.append(condition)
+        if self.use_kwargs:
+            self._add_arg_names(event)
         return self
 
     def remove(self):
-        for i, (target, event) in enumerate(self.targets):
-            sa.event.remove(target, identifier, self._get_callback(i))
+        for target, event, callback in self._registered:
+            unregister(target, event, callback)
+        self._registered.clear()
+        for target, chain_registrations in list(self._chained.items()):
+            for event, callback in chain_registrations:
+                unregister(target, event, callback)
+        self._chained.clear()
 
     def __repr__(self):
         clsname = type(self).__name__
@@ -326,7 +474,7 @@ def before_save(model, session, **kwargs):
     def decorator(func):
         @EventListener(session, 'before_flush', **kwargs)
         def wrapper(session, flush_context, instances):
-            for instance in set(session.new) | set(session.dirty):
+            for instance in it.chain(session.new, session.dirty):
                 func(session, flush_context, instances, instance)
         return wrapper
     return decorator
@@ -350,7 +498,7 @@ def before_touch(model, session, **kwargs):
     def decorator(func):
         @EventListener(session, 'before_flush', **kwargs)
         def wrapper(session, flush_context, instances):
-            for instance in set(session.new) | set(session.dirty) | set(session.deleted):
+            for instance in it.chain(session.new, session.dirty, session.deleted):
                 func(session, flush_context, instances, instance)
         return wrapper
     return decorator
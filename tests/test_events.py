@@ -1,4 +1,10 @@
+import gc
+import inspect
 import logging
+import os
+import subprocess
+import sys
+import weakref
 import pytest
 import sqlalchemy as sa
 import sqlalchemy.event
@@ -136,3 +142,205 @@ def test_basic_mapper_event_listeners(
     assert not callback.called, "not called before commit"
     db.commit()
     assert callback.called is called_after_deleted
+
+
+def test_chained_listener_use_kwargs(base, session, engine, mocker):
+    class Foo(base):
+        __tablename__ = "foos"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String)
+
+    callback = mocker.Mock()
+    callback.__name__ = 'kwargs_callback'
+    events.after_insert(Foo, use_kwargs=True)(callback)
+
+    base.metadata.create_all(engine)
+    db = session()
+    foo = Foo(name="foo")
+    db.add(foo)
+    db.commit()
+
+    callback.assert_called_once()
+    kwargs = callback.call_args.kwargs
+    assert kwargs["target"] is foo
+    assert kwargs["session"] is db
+    assert set(kwargs) == {"mapper", "connection", "target", "session", "flush_context"}
+
+
+def test_chained_listener_args_not_shared_between_fires(base, session, engine, mocker):
+    class Foo(base):
+        __tablename__ = "foos"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String)
+
+    callback = mocker.Mock()
+    callback.__name__ = 'args_callback'
+    events.after_insert(Foo)(callback)
+
+    base.metadata.create_all(engine)
+    db = session()
+    for name in ("foo", "bar"):
+        foo = Foo(name=name)
+        db.add(foo)
+        db.commit()
+        mapper, connection, target, *rest = callback.call_args.args
+        assert target is foo
+        assert len(rest) == 2
+
+
+@pytest.mark.parametrize(
+    "event_listener",
+    [
+        lambda model, session: events.after_insert(model),
+        lambda model, session: events.after_save(model),
+        events.before_insert,
+    ],
+)
+def test_remove_listener(event_listener, base, session, engine, mocker):
+    class Foo(base):
+        __tablename__ = "foos"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String)
+
+    callback = mocker.Mock()
+    callback.__name__ = 'removed_callback'
+    wrapper = event_listener(Foo, session)(callback)
+
+    base.metadata.create_all(engine)
+    db = session()
+    db.add(Foo(name="foo"))
+    db.commit()
+    assert callback.call_count == 1
+
+    wrapper.__listener__.remove()
+    db.add(Foo(name="bar"))
+    db.commit()
+    assert callback.call_count == 1
+
+
+def test_event_listener_weakref():
+    listener = events.EventListener(sa.orm.Session, "before_flush")
+    assert weakref.ref(listener)() is listener
+    assert not hasattr(listener, "__dict__")
+
+
+def test_unknown_event(base, session, mocker):
+    class Foo(base):
+        __tablename__ = "foos"
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    callback = mocker.Mock()
+    callback.__name__ = 'unknown_callback'
+    listener = events.EventListener(Foo, "not_an_event")
+    with pytest.raises(sa.exc.InvalidRequestError, match="No such event"):
+        listener(callback)
+
+    with pytest.raises(ValueError, match="not_an_event"):
+        events.EventListener(Foo, "not_an_event", use_kwargs=True)
+
+
+def test_chain_registrations_do_not_keep_sessions_alive(base, session, engine):
+    class Foo(base):
+        __tablename__ = "foos"
+        id = sa.Column(sa.Integer, primary_key=True)
+        name = sa.Column(sa.String)
+
+    # a Mock would keep the sessions alive through its recorded call args
+    calls = []
+
+    @events.after_insert(Foo)
+    def callback(*args):
+        calls.append(len(args))
+
+    base.metadata.create_all(engine)
+    session_refs = []
+    for i in range(10):
+        db = session()
+        session_refs.append(weakref.ref(db))
+        db.add(Foo(name=str(i)))
+        db.commit()
+        db.close()
+    del db
+    gc.collect()
+
+    assert len(calls) == 10
+    listener = callback.__listener__
+    assert len(listener._registered) == 1
+    assert len(listener._chained) == 0
+    assert all(ref() is None for ref in session_refs)
+
+
+def test_custom_event_use_kwargs():
+    class Thing:
+        pass
+
+    class ThingEvents(sa.event.Events):
+        _dispatch_target = Thing
+
+        def poked(self, thing, amount):
+            pass
+
+    events.events.update(events.EventInfo.from_event_class(ThingEvents))
+    try:
+        calls = []
+
+        @events.EventListener(Thing, "poked", use_kwargs=True)
+        def callback(**kwargs):
+            calls.append(kwargs)
+
+        thing = Thing()
+        thing.dispatch.poked(thing, 3)
+        assert calls == [{"thing": thing, "amount": 3}]
+    finally:
+        del events.events["poked"]
+
+
+def test_events_builtin_layer_read_only():
+    info = events.events["before_flush"]
+    events.events["before_flush"] = events.EventInfo(object, (), 0)
+    events.events["custom_event"] = events.EventInfo(object, (), 0)
+
+    events.events.clear()
+    assert events.events["before_flush"] == info
+    assert "custom_event" not in events.events
+    assert events.events.pop("before_flush", None) is None
+    with pytest.raises(KeyError):
+        del events.events["before_flush"]
+
+
+def test_events_introspected_lazily():
+    script = "\n".join([
+        "from sqlalchemy_hooks import events",
+        "assert events._callback_args.cache_info().misses == 0",
+        "assert events.events_for.cache_info().currsize == 0",
+        "assert 'before_flush' in events.events",
+        "assert 'not_an_event' not in events.events",
+        "assert events.events_for.cache_info().currsize == 0",
+        "events.events['before_flush']",
+        "assert events.events_for.cache_info().currsize == 1",
+        "assert events.events_for('session_events') is events.session_events",
+        "assert events.events_for.cache_info().currsize == 1",
+    ])
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=repo_root)
+
+
+def test_callback_args_matches_signature():
+    # SQLAlchemy's Events metaclass rejects classmethods, so the bound method
+    # comes from a plain class
+    class ThingEvents:
+        @classmethod
+        def poked(cls, thing, amount):
+            pass
+
+    def declared(thing, amount):
+        pass
+
+    def prodded(self, raw_thing):
+        pass
+
+    prodded.__signature__ = inspect.signature(declared)
+
+    for method in (ThingEvents.poked, prodded):
+        expected = tuple(inspect.signature(method).parameters)
+        assert events._callback_args(method) == expected == ("thing", "amount")